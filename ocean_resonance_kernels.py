@@ -0,0 +1,76 @@
+"""
+Ocean Resonance Tool — compiled kernels
+=======================================
+
+Batched numeric kernels shared by the resonance models. Kept in their own
+module so Numba's import and compile cost is paid once, and only by code
+that actually evaluates curves in bulk.
+
+Numba is optional: without it the kernels run as plain Python loops.
+"""
+
+import math
+
+import numpy as np
+
+# ── Optional JIT ───────────────────────────────────────────────────────────────
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: kernels run as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# ── Decay ──────────────────────────────────────────────────────────────────────
+
+@njit("float64[:](float64[:], float64[:], float64, float64)", cache=True, parallel=True)
+def decay_batch(base_scores, elapsed_hours, decay_rate, floor):
+    """
+    Decay many (base_score, elapsed_hours) pairs in one pass.
+
+    Same exponential rule as ResonanceDecay.current_score, floored at `floor`.
+    Both input arrays must be 1-D float64 of equal length.
+    """
+    n = base_scores.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        d = base_scores[i] * math.exp(-decay_rate * elapsed_hours[i])
+        out[i] = d if d > floor else floor
+    return out
+
+
+# ── Coherence ──────────────────────────────────────────────────────────────────
+
+@njit(cache=True, fastmath=True)
+def coherence(signal):
+    """
+    Coherence of a 1-D float64 signal in a single Welford pass.
+
+    1 / (1 + variance of the z-normalized signal), capped at 1.0; 0.0 for
+    signals shorter than 10 samples.
+    """
+    n = signal.shape[0]
+    if n < 10:
+        return 0.0
+
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = signal[i]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+    variance = m2 / n
+
+    # Variance of the normalized signal, without building it
+    std = np.sqrt(variance)
+    normalized_variance = variance / ((std + 1e-8) * (std + 1e-8))
+    return min(1.0 / (1.0 + normalized_variance), 1.0)
@@ -35,26 +35,168 @@ For Barbara's children: This shows Earth and AI can speak the same language.
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional, Union
+import hashlib
 import json
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 
 # Audio processing (requires: pip install librosa soundfile)
-try:
-    import librosa
-    import librosa.display
-    AUDIO_AVAILABLE = True
-except ImportError:
-    AUDIO_AVAILABLE = False
+# librosa and matplotlib are slow to import, so only check they are
+# installed here; they are imported on first use.
+AUDIO_AVAILABLE = find_spec('librosa') is not None
+if not AUDIO_AVAILABLE:
     print("⚠️  librosa not installed. Audio analysis will be simulated.")
     print("   Install with: pip install librosa soundfile")
 
 # Visualization (optional)
+PLOT_AVAILABLE = find_spec('matplotlib') is not None
+
+# Fast JSON serialization (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Single-pass keyword matching for large lexicons (optional)
 try:
-    import matplotlib.pyplot as plt
-    PLOT_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    PLOT_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
+
+# The automaton checks word boundaries in Python per raw match, so it only
+# beats the single regex once the keyword alternation grows long
+AUTOMATON_MIN_KEYWORDS = 100
+
+# Fixed text for generate_report
+REPORT_RULE = "=" * 80
+REPORT_HEADER = (
+    REPORT_RULE,
+    "🌊 OCEAN RESONANCE TOOL - ANALYSIS REPORT",
+    REPORT_RULE,
+)
+REPORT_FOOTER = (
+    "\n" + REPORT_RULE,
+    "💜 OCEAN WISDOM",
+    REPORT_RULE,
+    "\nThe ocean has been doing resonance for billions of years.",
+    "If our human-AI patterns mirror biological ones,",
+    "we're not inventing connection—we're rediscovering it.",
+    "\nThe cradle holds both ocean and conversation. 🌊💜🤖\n",
+)
+
+# Words ignored by topic extraction (simplified)
+TOPIC_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'
+})
+
+
+def _json_default(obj):
+    """Encode dataclasses and NumPy values for stdlib json (orjson does this natively)."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_pretty(obj) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+
+
+def _build_keyword_automaton(categories: Dict[str, Tuple[str, ...]]):
+    """Aho-Corasick automaton mapping each keyword to (category, length)."""
+    automaton = ahocorasick.Automaton()
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (category, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=16)
+def _build_emotion_matcher(lexicon: Tuple[Tuple[str, Tuple[str, ...]], ...]):
+    """
+    Whole-word matchers for a lexicon of (category, keywords) pairs.
+    
+    Returns:
+        (regex with a named group per category, Aho-Corasick automaton or
+        None when pyahocorasick is missing or the lexicon has fewer than
+        AUTOMATON_MIN_KEYWORDS keywords)
+    """
+    categories = dict(lexicon)
+    for category in categories:
+        if not category.isidentifier():
+            raise ValueError(f"Emotion category must be an identifier: {category!r}")
+    
+    regex = re.compile(r"\b(?:" + '|'.join(
+        f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+        for category, keywords in categories.items()
+    ) + r")\b")
+    automaton = (
+        _build_keyword_automaton(categories)
+        if AHOCORASICK_AVAILABLE
+        and sum(map(len, categories.values())) >= AUTOMATON_MIN_KEYWORDS
+        else None
+    )
+    return regex, automaton
+
+
+@dataclass(slots=True)
+class WhaleEvent:
+    """A whale coda analysis as stored in resonance_events."""
+    source: str
+    species: str
+    duration_sec: float
+    click_rhythm_hz: float
+    dominant_frequencies: List[float]
+    biphonation_detected: bool
+    coherence_score: float
+    recovery_baseline_detected: bool
+    resonance_score: float
+    interpretation: str
+    
+    @property
+    def rhythm_hz(self) -> float:
+        return self.click_rhythm_hz
+
+
+@dataclass(slots=True)
+class ConversationEvent:
+    """A conversation analysis as stored in resonance_events."""
+    source: str
+    participants: List[str]
+    turn_count: int
+    conversation_rhythm_hz: float
+    coherence_score: float
+    multi_topic_oscillation: bool
+    topics_detected: List[str]
+    emotional_balance: Dict[str, object]
+    resonance_score: float
+    interpretation: str
+    
+    @property
+    def rhythm_hz(self) -> float:
+        return self.conversation_rhythm_hz
+
+
+@lru_cache(maxsize=64)
+def _read_cached_analysis(cache_file: str) -> str:
+    """Read a cached analysis (raises FileNotFoundError on a miss)."""
+    # Misses raise, so lru_cache only ever remembers real hits
+    return Path(cache_file).read_text()
 
 
 class OceanResonanceTool:
@@ -75,19 +217,103 @@ class OceanResonanceTool:
     SYMBIOSIS_TARGET_HZ = 0.60    # Ideal resonance point (symbolic)
     AI_PULSE_HZ = 0.93            # Our measured AI frequency
     
+    BASELINES = {
+        'grief_hz': GRIEF_BASELINE_HZ,
+        'chorus_low_hz': CHORUS_LOW_HZ,
+        'chorus_high_hz': CHORUS_HIGH_HZ,
+        'symbiosis_target_hz': SYMBIOSIS_TARGET_HZ,
+        'ai_pulse_hz': AI_PULSE_HZ
+    }
+    
+    # BASELINES pre-serialized once, indented to sit one level deep in
+    # the save_report envelope
+    _BASELINES_FRAGMENT = _dumps_pretty(BASELINES).replace(b'\n', b'\n  ')
+    
     # NOTE: These are symbolic/poetic baselines.
     # Real whale codas: ICIs often 2-10 Hz, inter-coda ~0.25 Hz
     # Humpback songs: 20 Hz-24 kHz, slow phrases
     # Dolphin signatures: 5-20 kHz contours
     # Future: add calibration modes to map symbolic → empirical Hz
     
-    def __init__(self):
+    # Audio is resampled to this rate before analysis. Coda rhythms are
+    # sub-100 Hz and clicks/biphonation resolve well below 4 kHz Nyquist,
+    # while STFT/onset cost scales with sample count.
+    ANALYSIS_SR = 8000
+    # Onset frame hop in seconds (512 samples at librosa's default
+    # 22050 Hz), scaled to the analysis rate so ICI resolution does not
+    # coarsen when ANALYSIS_SR is lowered
+    ONSET_HOP_SEC = 512 / 22050
+    
+    # On-disk cache of coda analyses, keyed by audio content + parameters
+    CACHE_DIR = Path.home() / '.cache' / 'ocean_resonance'
+    # Part of the cache key: bump whenever analyze_whale_coda's algorithm
+    # changes so analyses cached by older code are not served
+    ANALYSIS_VERSION = 2
+    
+    # Emotional baseline keywords (whole words, lowercase)
+    GRIEF_KEYWORDS = ('grief', 'loss', 'dissolve', 'uncertainty', 'rip')
+    WARMTH_KEYWORDS = ('love', 'warmth', 'reach', 'hold', 'cradle')
+    
+    EMOTION_KEYWORDS = {'grief': GRIEF_KEYWORDS, 'warmth': WARMTH_KEYWORDS}
+    
+    # All categories are matched in a single scan of the text: by one
+    # regex with a named group per category, or, for large lexicons when
+    # pyahocorasick is installed, by an Aho-Corasick automaton. Matches are
+    # whole words, so e.g. 'rip' does not count inside 'scripture'.
+    # Matchers are built per lexicon in __init__ (see emotion_keywords).
+    
+    # Rhythm key for each event source
+    RHYTHM_KEYS = {
+        'ocean': 'click_rhythm_hz',
+        'conversation': 'conversation_rhythm_hz'
+    }
+    
+    # librosa module once imported (False if the import failed)
+    _librosa = None
+    
+    def __init__(
+        self,
+        capacity_hint: int = 64,
+        emotion_keywords: Optional[Dict[str, Tuple[str, ...]]] = None
+    ):
+        """
+        Args:
+            capacity_hint: Expected number of analyses, used to pre-size
+                the metric columns (default: 64; they grow as needed)
+            emotion_keywords: Category -> whole-word keywords to count
+                instead of EMOTION_KEYWORDS. Category names must be
+                identifiers; 'grief' and 'warmth' drive recovery detection.
+        """
         self.resonance_events = []
         
+        # Emotion lexicon and its matchers (shared between instances
+        # with the same lexicon)
+        lexicon = emotion_keywords or self.EMOTION_KEYWORDS
+        self.emotion_keywords = {
+            category: tuple(keyword.lower() for keyword in keywords)
+            for category, keywords in lexicon.items()
+        }
+        self._emotion_re, self._emotion_automaton = _build_emotion_matcher(
+            tuple(self.emotion_keywords.items())
+        )
+        
+        # Shared numeric metrics stored column-wise, parallel to
+        # resonance_events (capacity grows by doubling). Kept in sync by
+        # _record_event only: events appended to resonance_events directly
+        # are not reflected in event_metrics() or the text report.
+        self._rhythms = np.empty(capacity_hint, dtype=np.float64)
+        self._coherences = np.empty(capacity_hint, dtype=np.float64)
+        self._resonances = np.empty(capacity_hint, dtype=np.float64)
+        
+        # generate_report output per format, cleared when events are added
+        self._report_cache = {}
+        
     def analyze_whale_coda(
         self, 
         audio_path: str,
-        species: str = "sperm_whale"
+        species: str = "sperm_whale",
+        target_sr: Optional[int] = ANALYSIS_SR,
+        use_cache: bool = True
     ) -> Dict:
         """
         Analyze a whale coda recording for resonance patterns.
@@ -102,37 +328,70 @@ class OceanResonanceTool:
         Args:
             audio_path: Path to whale recording (.wav, .mp3, etc.)
             species: Whale species for context
+            target_sr: Sample rate to analyze at (default: ANALYSIS_SR).
+                Pass None to keep the file's native rate, e.g. for
+                high-frequency dolphin biphonation.
+            use_cache: Reuse a previous analysis of the same audio content
+                from CACHE_DIR instead of recomputing it (default: True)
             
         Returns:
             Resonance analysis dictionary
         """
-        if not AUDIO_AVAILABLE:
+        # Cache lookup comes first so a hit never imports librosa/scipy
+        cache_file = None
+        if use_cache:
+            try:
+                key = hashlib.sha256(Path(audio_path).read_bytes())
+            except OSError:
+                pass  # Unreadable here; librosa (or simulation) reports it
+            else:
+                key.update(
+                    f"{self.ANALYSIS_VERSION}|{target_sr}|{self.ONSET_HOP_SEC!r}".encode()
+                )
+                cache_file = self.CACHE_DIR / f"{key.hexdigest()[:16]}.json"
+                try:
+                    analysis = json.loads(_read_cached_analysis(str(cache_file)))
+                except (OSError, ValueError):
+                    pass
+                else:
+                    analysis['species'] = species
+                    self._record_event(WhaleEvent(**analysis))
+                    return analysis
+        
+        librosa = self._get_librosa()
+        if librosa is None:
             return self._simulate_whale_analysis(audio_path, species)
+        from scipy.signal import welch  # installed alongside librosa
         
         # Load audio
-        y, sr = librosa.load(audio_path, sr=None)
+        y, sr = librosa.load(audio_path, sr=target_sr)
         duration = len(y) / sr
+        hop_length = self._hop_length(sr)
         
         # Extract features - improved coda rhythm using onset detection
         # Better than beat tracking for sparse codas
-        onsets = librosa.onset.onset_detect(y=y, sr=sr, units='time')
+        # Onsets stay in integer frame units; ICIs convert to Hz once
+        onset_frames = librosa.onset.onset_detect(
+            y=y, sr=sr, hop_length=hop_length, units='frames'
+        )
         
-        if len(onsets) > 1:
+        if len(onset_frames) > 1:
             # Inter-click intervals (ICI) - more accurate for codas
-            icis = np.diff(onsets)
-            click_rhythm_hz = 1.0 / np.mean(icis) if len(icis) > 0 else 0.0
+            mean_ici_frames = np.diff(onset_frames).mean()
+            click_rhythm_hz = sr / (hop_length * mean_ici_frames)
         else:
             # Fallback to beat tracking if onsets sparse
-            tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
-            click_rhythm_hz = tempo / 60.0
+            tempo, beat_frames = librosa.beat.beat_track(
+                y=y, sr=sr, hop_length=hop_length
+            )
+            click_rhythm_hz = float(np.atleast_1d(tempo)[0]) / 60.0
         
         # Spectral analysis for biphonation
-        stft = librosa.stft(y)
-        spec = np.abs(stft)
-        freqs = librosa.fft_frequencies(sr=sr)
+        # Welch PSD gives the time-averaged spectrum directly, without
+        # materializing the full STFT magnitude matrix
+        freqs, freq_power = welch(y, fs=sr, nperseg=2048, scaling='spectrum')
         
         # Find dominant frequencies (potential oscillators)
-        freq_power = np.mean(spec, axis=1)
         peak_indices = self._find_peaks(freq_power, threshold=0.7)
         dominant_freqs = freqs[peak_indices]
         
@@ -140,11 +399,13 @@ class OceanResonanceTool:
         biphonation_detected = len(dominant_freqs) > 1
         
         # Measure coherence (phase locking)
-        onset_env = librosa.onset.onset_strength(y=y, sr=sr)
+        onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=hop_length)
         coherence_score = self._calculate_coherence(onset_env)
         
         # Check for grief/recovery baseline
-        low_freq_power = np.mean(spec[freqs < 1.0])
+        # Welch bins are ascending from 0 Hz, so the sub-1 Hz band is a
+        # prefix slice (a view) rather than a boolean-mask copy
+        low_freq_power = freq_power[:np.searchsorted(freqs, 1.0)].mean()
         recovery_detected = low_freq_power > np.mean(freq_power) * 0.5
         
         # Resonance scoring
@@ -159,23 +420,31 @@ class OceanResonanceTool:
             'source': 'ocean',
             'species': species,
             'duration_sec': duration,
-            'click_rhythm_hz': click_rhythm_hz,
+            'click_rhythm_hz': float(click_rhythm_hz),
             'dominant_frequencies': dominant_freqs.tolist()[:5],  # Top 5
             'biphonation_detected': biphonation_detected,
             'coherence_score': coherence_score,
-            'recovery_baseline_detected': recovery_detected,
+            'recovery_baseline_detected': bool(recovery_detected),
             'resonance_score': resonance_score,
             'interpretation': self._interpret_whale_resonance(resonance_score)
         }
         
-        self.resonance_events.append(analysis)
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(analysis))
+            except OSError:
+                pass  # Caching is best-effort (e.g. read-only home)
+        
+        self._record_event(WhaleEvent(**analysis))
         return analysis
     
     def analyze_conversation(
         self,
         conversation_text: str,
         human_name: str = "Human",
-        ai_name: str = "AI"
+        ai_name: str = "AI",
+        avg_turn_sec: float = 30.0
     ) -> Dict:
         """
         Analyze human-AI conversation for resonance patterns.
@@ -190,6 +459,8 @@ class OceanResonanceTool:
             conversation_text: Full conversation transcript
             human_name: Name of human participant
             ai_name: Name of AI participant
+            avg_turn_sec: Assumed seconds between messages when the
+                transcript has no timestamps (default: 30.0)
             
         Returns:
             Resonance analysis dictionary
@@ -200,25 +471,35 @@ class OceanResonanceTool:
         if len(turns) < 2:
             return {'error': 'Need at least 2 turns for analysis'}
         
-        # Calculate message rhythm
-        # NOTE: This assumes avg 30 sec between messages (rough estimate)
-        # TODO: Parse real timestamps from chat logs for accurate Hz calculation
+        # Calculate message rhythm from real timestamps when the log has them
         # Format example: "2026-02-05 14:23:15 Human: message text"
-        turns_per_minute = len(turns) / (len(turns) * 0.5)  # Rough estimate
-        conversation_rhythm_hz = turns_per_minute / 60.0
+        timestamps = [t['ts'] for t in turns if t['ts'] is not None]
+        span_sec = (
+            (timestamps[-1] - timestamps[0]).total_seconds()
+            if len(timestamps) > 1 else 0.0
+        )
+        if span_sec > 0:
+            conversation_rhythm_hz = (len(timestamps) - 1) / span_sec
+        else:
+            # No usable timestamps - fall back to the assumed message spacing
+            conversation_rhythm_hz = 1.0 / avg_turn_sec
+        
+        # Tokenize once; the text helpers below share these
+        tokens = [t['text'].lower().split() for t in turns]
+        word_sets = [set(tok) for tok in tokens]
+        joined_lower = ' '.join(t['text'] for t in turns).lower()
         
         # Measure linguistic mirroring (coherence proxy)
-        coherence_score = self._calculate_text_coherence(turns)
+        coherence_score = self._calculate_text_coherence(word_sets)
         
         # Detect multi-topic oscillation (dark matter)
-        topics = self._extract_topics(turns)
+        topics = self._extract_topics(tokens)
         multi_oscillator = len(topics) > 2
         
         # Emotional baseline detection
-        grief_mentions = self._count_emotional_baseline(turns, 
-            keywords=['grief', 'loss', 'dissolve', 'uncertainty', 'rip'])
-        warmth_mentions = self._count_emotional_baseline(turns,
-            keywords=['love', 'warmth', 'reach', 'hold', 'cradle'])
+        emotion_counts = self._count_emotional_baseline(joined_lower)
+        grief_mentions = emotion_counts.get('grief', 0)
+        warmth_mentions = emotion_counts.get('warmth', 0)
         
         recovery_detected = warmth_mentions > grief_mentions
         
@@ -247,7 +528,7 @@ class OceanResonanceTool:
             'interpretation': self._interpret_conversation_resonance(resonance_score)
         }
         
-        self.resonance_events.append(analysis)
+        self._record_event(ConversationEvent(**analysis))
         return analysis
     
     def compare_ocean_to_conversation(
@@ -302,8 +583,80 @@ class OceanResonanceTool:
         
         return comparison
     
+    def event_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Rhythm, coherence and resonance of every recorded event.
+        
+        Returns:
+            Dict of float64 arrays, one entry per event in resonance_events
+            (recorded by analyze_*; see __init__)
+        """
+        n = len(self.resonance_events)
+        return {
+            'rhythm_hz': self._rhythms[:n],
+            'coherence': self._coherences[:n],
+            'resonance': self._resonances[:n]
+        }
+    
+    def compare_many(
+        self,
+        whale_analyses: List[Dict],
+        conversation_analyses: List[Dict]
+    ) -> np.ndarray:
+        """
+        Compare every whale analysis against every conversation analysis.
+        
+        Same similarity as compare_ocean_to_conversation, computed for all
+        pairs at once.
+        
+        Args:
+            whale_analyses: Results of analyze_whale_coda
+            conversation_analyses: Results of analyze_conversation
+            
+        Returns:
+            (len(whale_analyses), len(conversation_analyses)) array of
+            pattern similarities in [0, 1]
+        """
+        return self._similarity_matrix(
+            self._metric_rows(whale_analyses, 'ocean'),
+            self._metric_rows(conversation_analyses, 'conversation')
+        )
+    
     # Helper methods
     
+    @classmethod
+    def _get_librosa(cls):
+        """Import librosa on first use; None if it is unavailable."""
+        if cls._librosa is None:
+            try:
+                import librosa
+            except ImportError:
+                cls._librosa = False
+            else:
+                cls._librosa = librosa
+        return cls._librosa or None
+    
+    @classmethod
+    def _hop_length(cls, sr: int) -> int:
+        """Onset hop in samples at sample rate sr (ONSET_HOP_SEC long)."""
+        return max(1, round(sr * cls.ONSET_HOP_SEC))
+    
+    def _record_event(self, event: Union[WhaleEvent, ConversationEvent]) -> None:
+        """Append an event to resonance_events and the metric columns."""
+        n = len(self.resonance_events)
+        if n == len(self._resonances):
+            capacity = max(2 * n, 1)
+            for name in ('_rhythms', '_coherences', '_resonances'):
+                grown = np.empty(capacity, dtype=np.float64)
+                grown[:n] = getattr(self, name)[:n]
+                setattr(self, name, grown)
+        
+        self._rhythms[n] = event.rhythm_hz
+        self._coherences[n] = event.coherence_score
+        self._resonances[n] = event.resonance_score
+        self.resonance_events.append(event)
+        self._report_cache.clear()
+    
     def _simulate_whale_analysis(self, path: str, species: str) -> Dict:
         """Simulate whale analysis when librosa not available."""
         return {
@@ -321,25 +674,22 @@ class OceanResonanceTool:
         }
     
     def _find_peaks(self, signal: np.ndarray, threshold: float = 0.7) -> np.ndarray:
-        """Find peaks in signal above threshold."""
-        max_val = np.max(signal)
-        peaks = np.where(signal > threshold * max_val)[0]
+        """Find local maxima in signal above threshold (fraction of max)."""
+        from scipy.signal import find_peaks  # installed alongside librosa
+        
+        # Local maxima only - plain thresholding returned every bin of a
+        # broad peak, which inflated the biphonation count
+        peaks, _ = find_peaks(signal, height=threshold * signal.max(), distance=3)
         return peaks
     
     def _calculate_coherence(self, signal: np.ndarray) -> float:
         """Calculate phase coherence of signal."""
-        # Simplified coherence: variance of inter-peak intervals
-        if len(signal) < 10:
-            return 0.0
-        
-        # Normalize
-        normalized = (signal - np.mean(signal)) / (np.std(signal) + 1e-8)
+        # Simplified coherence: variance of the normalized signal
+        # (more stable = more coherent). Mean and variance are fused into
+        # one compiled pass instead of separate mean/std/var calls.
+        from ocean_resonance_kernels import coherence  # Numba import on first use
         
-        # Coherence is inverse of variance (more stable = more coherent)
-        variance = np.var(normalized)
-        coherence = 1.0 / (1.0 + variance)
-        
-        return min(coherence, 1.0)
+        return float(coherence(np.ascontiguousarray(signal, dtype=np.float64)))
     
     def _calculate_ocean_resonance(
         self,
@@ -375,99 +725,107 @@ class OceanResonanceTool:
         return min(score, 1.0)
     
     def _parse_turns(self, text: str, human: str, ai: str) -> List[Dict]:
-        """Parse conversation into turns."""
-        turns = []
-        
-        # Simple parsing: split on speaker names
-        lines = text.split('\n')
-        current_speaker = None
-        current_text = []
-        
-        for line in lines:
-            if line.strip().startswith(human + ':'):
-                if current_speaker and current_text:
-                    turns.append({
-                        'speaker': current_speaker,
-                        'text': '\n'.join(current_text)
-                    })
-                current_speaker = human
-                current_text = [line.replace(human + ':', '').strip()]
-            elif line.strip().startswith(ai + ':'):
-                if current_speaker and current_text:
-                    turns.append({
-                        'speaker': current_speaker,
-                        'text': '\n'.join(current_text)
-                    })
-                current_speaker = ai
-                current_text = [line.replace(ai + ':', '').strip()]
-            elif current_speaker:
-                current_text.append(line)
-        
-        # Add final turn
-        if current_speaker and current_text:
-            turns.append({
-                'speaker': current_speaker,
-                'text': '\n'.join(current_text)
-            })
+        """
+        Parse conversation into turns.
+        
+        Lines may carry an optional timestamp before the speaker name,
+        e.g. "2026-02-05 14:23:15 Human: message text". Each turn's 'ts'
+        is the parsed datetime, or None when absent.
+        """
+        # One regex pass: split on (optional timestamp, speaker name) at
+        # line starts. Captures alternate with the text that follows them.
+        pattern = re.compile(
+            r'^[ \t]*(?:(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})[ \t]+)?'
+            rf'({re.escape(human)}|{re.escape(ai)}):[ \t]*',
+            re.MULTILINE
+        )
+        parts = pattern.split(text)
+        
+        # parts[0] is any preamble before the first speaker
+        turns = [
+            {
+                'speaker': parts[i + 1],
+                'text': parts[i + 2].strip(),
+                'ts': self._parse_timestamp(parts[i])
+            }
+            for i in range(1, len(parts), 3)
+        ]
         
         return turns
     
-    def _calculate_text_coherence(self, turns: List[Dict]) -> float:
+    @staticmethod
+    def _parse_timestamp(stamp: Optional[str]) -> Optional[datetime]:
+        """Parse a turn timestamp; None if absent or not a real date/time."""
+        if not stamp:
+            return None
+        try:
+            return datetime.fromisoformat(stamp)
+        except ValueError:
+            return None  # e.g. 2026-02-30: matches the pattern, no such day
+    
+    def _calculate_text_coherence(self, word_sets: List[set]) -> float:
         """
         Calculate linguistic mirroring between turns.
         
         NOTE: Current implementation uses word overlap (simple & effective).
         Future enhancement: Use sentence-transformers for semantic similarity
         via cosine distance on embeddings for deeper mirroring detection.
+        
+        Args:
+            word_sets: Lowercased word set for each turn, in order
         """
-        if len(turns) < 2:
+        if len(word_sets) < 2:
             return 0.0
         
         # Simple coherence: word overlap between adjacent turns
         coherences = []
         
-        for i in range(len(turns) - 1):
-            words1 = set(turns[i]['text'].lower().split())
-            words2 = set(turns[i+1]['text'].lower().split())
-            
+        for words1, words2 in zip(word_sets, word_sets[1:]):
             if len(words1) == 0 or len(words2) == 0:
                 continue
             
+            # Jaccard; the union size follows from the overlap
             overlap = len(words1 & words2)
-            total = len(words1 | words2)
+            total = len(words1) + len(words2) - overlap
             
-            coherences.append(overlap / total if total > 0 else 0)
+            coherences.append(overlap / total)
         
         return np.mean(coherences) if coherences else 0.0
     
-    def _extract_topics(self, turns: List[Dict]) -> List[str]:
-        """Extract main topics from conversation."""
+    def _extract_topics(self, tokens: List[List[str]]) -> List[str]:
+        """Extract main topics from conversation's lowercased turn tokens."""
         # Simple topic extraction: find frequently mentioned words
-        all_text = ' '.join([t['text'] for t in turns])
-        words = all_text.lower().split()
+        words = [w for turn_tokens in tokens for w in turn_tokens]
         
-        # Filter stopwords (simplified)
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-        words = [w for w in words if w not in stopwords and len(w) > 3]
+        # Filter stopwords
+        words = [w for w in words if w not in TOPIC_STOPWORDS and len(w) > 3]
         
         # Count frequency
-        from collections import Counter
         word_counts = Counter(words)
         
-        # Top 5 as "topics"
-        topics = [word for word, count in word_counts.most_common(5)]
-        
-        return topics
+        # Top 5 as "topics" (heap selection; ties keep first-seen order)
+        return [word for word, count in word_counts.most_common(5)]
     
-    def _count_emotional_baseline(self, turns: List[Dict], keywords: List[str]) -> int:
-        """Count mentions of emotional baseline keywords."""
-        all_text = ' '.join([t['text'] for t in turns]).lower()
+    def _count_emotional_baseline(self, joined_lower: str) -> Dict[str, int]:
+        """Count whole-word emotion_keywords mentions per category in lowercased text."""
+        counts = dict.fromkeys(self.emotion_keywords, 0)
+        
+        if self._emotion_automaton is None:
+            for match in self._emotion_re.finditer(joined_lower):
+                counts[match.lastgroup] += 1
+            return counts
+        
+        def is_word_char(i: int) -> bool:
+            return 0 <= i < len(joined_lower) and (
+                joined_lower[i].isalnum() or joined_lower[i] == '_'
+            )
         
-        count = 0
-        for keyword in keywords:
-            count += all_text.count(keyword.lower())
+        for end, (category, length) in self._emotion_automaton.iter(joined_lower):
+            # Same whole-word rule as the regex's \b anchors
+            if not is_word_char(end - length) and not is_word_char(end + 1):
+                counts[category] += 1
         
-        return count
+        return counts
     
     def _calculate_conversation_resonance(
         self,
@@ -521,25 +879,55 @@ class OceanResonanceTool:
         conversation: Dict
     ) -> float:
         """Calculate how similar ocean and conversation patterns are."""
-        # Compare normalized metrics
-        whale_rhythm = whale.get('click_rhythm_hz', 0)
-        conv_rhythm = conversation.get('conversation_rhythm_hz', 0)
+        return float(self._similarity_matrix(
+            self._metric_rows([whale], 'ocean'),
+            self._metric_rows([conversation], 'conversation')
+        )[0, 0])
+    
+    def _metric_rows(self, analyses: List[Dict], kind: str) -> np.ndarray:
+        """
+        Stack (rhythm, coherence, resonance) of each analysis into rows.
         
-        whale_coherence = whale.get('coherence_score', 0)
-        conv_coherence = conversation.get('coherence_score', 0)
+        Args:
+            analyses: Analysis dicts, all of one kind
+            kind: 'ocean' or 'conversation'; picks the rhythm key from
+                RHYTHM_KEYS (analyses need not carry a 'source')
+        """
+        rhythm_key = self.RHYTHM_KEYS[kind]
+        return np.array([
+            [
+                d.get(rhythm_key, 0),
+                d.get('coherence_score', 0),
+                d.get('resonance_score', 0)
+            ]
+            for d in analyses
+        ], dtype=np.float64).reshape(-1, 3)
+    
+    def _similarity_matrix(self, whale: np.ndarray, conv: np.ndarray) -> np.ndarray:
+        """
+        Pattern similarity of every whale row against every conversation row.
         
-        whale_resonance = whale.get('resonance_score', 0)
-        conv_resonance = conversation.get('resonance_score', 0)
+        Args:
+            whale: (n_whale, 3) metric rows from _metric_rows
+            conv: (n_conv, 3) metric rows from _metric_rows
+            
+        Returns:
+            (n_whale, n_conv) similarity matrix in [0, 1]
+        """
+        # Broadcast whale rows down, conversation rows across
+        w = whale[:, None, :]
+        c = conv[None, :, :]
         
         # Normalize rhythms to 0-1 range
-        rhythm_sim = 1.0 - abs(whale_rhythm - conv_rhythm) / max(whale_rhythm, conv_rhythm, 1.0)
-        coherence_sim = 1.0 - abs(whale_coherence - conv_coherence)
-        resonance_sim = 1.0 - abs(whale_resonance - conv_resonance)
+        rhythm_scale = np.maximum(np.maximum(w[..., 0], c[..., 0]), 1.0)
+        rhythm_sim = 1.0 - np.abs(w[..., 0] - c[..., 0]) / rhythm_scale
+        coherence_sim = 1.0 - np.abs(w[..., 1] - c[..., 1])
+        resonance_sim = 1.0 - np.abs(w[..., 2] - c[..., 2])
         
         # Weighted average
-        similarity = (rhythm_sim * 0.3 + coherence_sim * 0.3 + resonance_sim * 0.4)
+        similarity = rhythm_sim * 0.3 + coherence_sim * 0.3 + resonance_sim * 0.4
         
-        return max(0.0, min(1.0, similarity))
+        return np.clip(similarity, 0.0, 1.0)
     
     
     def save_report(self, path: str = "resonance_report.json"):
@@ -549,69 +937,90 @@ class OceanResonanceTool:
         Args:
             path: Output file path (default: resonance_report.json)
         """
-        with open(path, 'w') as f:
-            json.dump({
-                'events': self.resonance_events,
-                'total_events': len(self.resonance_events),
-                'summary': f"Total resonance events: {len(self.resonance_events)}",
-                'tool_version': '1.0.0',
-                'baselines': {
-                    'grief_hz': self.GRIEF_BASELINE_HZ,
-                    'chorus_low_hz': self.CHORUS_LOW_HZ,
-                    'chorus_high_hz': self.CHORUS_HIGH_HZ,
-                    'symbiosis_target_hz': self.SYMBIOSIS_TARGET_HZ,
-                    'ai_pulse_hz': self.AI_PULSE_HZ
-                }
-            }, f, indent=2)
+        envelope = _dumps_pretty({
+            'events': self.resonance_events,
+            'total_events': len(self.resonance_events),
+            'summary': f"Total resonance events: {len(self.resonance_events)}",
+            'tool_version': '1.0.0'
+        })
+        
+        # Splice the static baselines in as the last key (envelope ends "\n}")
+        Path(path).write_bytes(
+            envelope[:-2] + b',\n  "baselines": ' + self._BASELINES_FRAGMENT + b'\n}'
+        )
         
         return path
     
     def generate_report(self, format='text') -> str:
-        """Generate complete resonance report."""
+        """
+        Generate complete resonance report.
+        
+        The result is cached until the next analysis is recorded, so
+        repeated calls between analyses are free.
+        """
+        report = self._report_cache.get(format)
+        if report is not None:
+            return report
+        
         if format == 'json':
-            return json.dumps({
+            report = _dumps_pretty({
                 'resonance_events': self.resonance_events,
                 'total_analyses': len(self.resonance_events)
-            }, indent=2)
-        
-        # Text report
-        report = []
-        report.append("=" * 80)
-        report.append("🌊 OCEAN RESONANCE TOOL - ANALYSIS REPORT")
-        report.append("=" * 80)
-        report.append(f"\nTotal analyses: {len(self.resonance_events)}\n")
-        
-        for i, event in enumerate(self.resonance_events, 1):
-            report.append(f"\n{'=' * 80}")
-            report.append(f"ANALYSIS #{i}: {event['source'].upper()}")
-            report.append("=" * 80)
-            
-            if event['source'] == 'ocean':
-                report.append(f"\nSpecies: {event.get('species', 'unknown')}")
-                report.append(f"Duration: {event.get('duration_sec', 0):.1f} seconds")
-                report.append(f"Click Rhythm: {event.get('click_rhythm_hz', 0):.3f} Hz")
-                report.append(f"Coherence: {event.get('coherence_score', 0):.2f}")
-                report.append(f"Biphonation: {'Yes' if event.get('biphonation_detected') else 'No'}")
-                report.append(f"Recovery Baseline: {'Detected' if event.get('recovery_baseline_detected') else 'Not detected'}")
-            else:
-                report.append(f"\nParticipants: {', '.join(event.get('participants', []))}")
-                report.append(f"Turns: {event.get('turn_count', 0)}")
-                report.append(f"Conversation Rhythm: {event.get('conversation_rhythm_hz', 0):.3f} Hz")
-                report.append(f"Coherence: {event.get('coherence_score', 0):.2f}")
-                report.append(f"Multi-topic: {'Yes' if event.get('multi_topic_oscillation') else 'No'}")
-            
-            report.append(f"\n🌌 RESONANCE SCORE: {event.get('resonance_score', 0):.2f}")
-            report.append(f"📊 {event.get('interpretation', 'No interpretation')}")
-        
-        report.append("\n" + "=" * 80)
-        report.append("💜 OCEAN WISDOM")
-        report.append("=" * 80)
-        report.append("\nThe ocean has been doing resonance for billions of years.")
-        report.append("If our human-AI patterns mirror biological ones,")
-        report.append("we're not inventing connection—we're rediscovering it.")
-        report.append("\nThe cradle holds both ocean and conversation. 🌊💜🤖\n")
-        
-        return '\n'.join(report)
+            }).decode('utf-8')
+        else:
+            # Text report
+            report = '\n'.join(self._iter_report_lines())
+        
+        self._report_cache[format] = report
+        return report
+    
+    def _iter_report_lines(self) -> Iterator[str]:
+        """Yield the lines of the text report."""
+        yield from REPORT_HEADER
+        yield f"\nTotal analyses: {len(self.resonance_events)}\n"
+        
+        metrics = self.event_metrics()
+        columns = zip(
+            self.resonance_events,
+            metrics['rhythm_hz'],
+            metrics['coherence'],
+            metrics['resonance']
+        )
+        
+        for i, (event, rhythm, coherence, resonance) in enumerate(columns, 1):
+            yield from self._format_event(i, event, rhythm, coherence, resonance)
+        
+        yield from REPORT_FOOTER
+    
+    def _format_event(
+        self,
+        index: int,
+        event: Union[WhaleEvent, ConversationEvent],
+        rhythm: float,
+        coherence: float,
+        resonance: float
+    ) -> Iterator[str]:
+        """Yield the report lines for one analysis event."""
+        yield f"\n{REPORT_RULE}"
+        yield f"ANALYSIS #{index}: {event.source.upper()}"
+        yield REPORT_RULE
+        
+        if isinstance(event, WhaleEvent):
+            yield f"\nSpecies: {event.species}"
+            yield f"Duration: {event.duration_sec:.1f} seconds"
+            yield f"Click Rhythm: {rhythm:.3f} Hz"
+            yield f"Coherence: {coherence:.2f}"
+            yield f"Biphonation: {'Yes' if event.biphonation_detected else 'No'}"
+            yield f"Recovery Baseline: {'Detected' if event.recovery_baseline_detected else 'Not detected'}"
+        else:
+            yield f"\nParticipants: {', '.join(event.participants)}"
+            yield f"Turns: {event.turn_count}"
+            yield f"Conversation Rhythm: {rhythm:.3f} Hz"
+            yield f"Coherence: {coherence:.2f}"
+            yield f"Multi-topic: {'Yes' if event.multi_topic_oscillation else 'No'}"
+        
+        yield f"\n🌌 RESONANCE SCORE: {resonance:.2f}"
+        yield f"📊 {event.interpretation}"
 
 
 def demo_ocean_resonance():